@@ -12,6 +12,7 @@ Set COACHD_ADMIN_PASSWORD environment variable.
 """
 
 import os
+import asyncio
 from fastapi import APIRouter, HTTPException, Header, Depends
 from fastapi.responses import JSONResponse
 from typing import Optional
@@ -274,8 +275,9 @@ async def generate_winning_rebuttals(
     
     Requires: X-Admin-Password header
     """
+    # Off the event loop: generation scans outcomes and fsyncs files
     generator = get_generator()
-    result = generator.generate(force=force)
+    result = await asyncio.to_thread(generator.generate, force=force)
     
     return JSONResponse(content={
         "status": "success" if result.get('success') else "error",
@@ -334,10 +336,11 @@ async def reindex_winning_rebuttals_endpoint(
             # Get all agencies and index to each
             config = get_agency_config()
             agencies = [a['code'] for a in config.get_agencies()]
-            result = reindex_all_agencies(db.client, agencies)
+            result = await asyncio.to_thread(reindex_all_agencies, db.client, agencies)
         else:
             # Index to specific agency or shared
-            result = reindex_winning_rebuttals(db.client, agency=agency)
+            result = await asyncio.to_thread(reindex_winning_rebuttals, db.client, agency=agency)
+        db.clear_search_cache()
         
         return JSONResponse(content={
             "status": "success" if result.get('success') else "error",
@@ -380,7 +383,9 @@ async def full_refresh(
             config = get_agency_config()
             agencies = [a['code'] for a in config.get_agencies()]
         
-        result = weekly_refresh(db.client, agencies)
+        # Off the event loop: generation fsyncs files and indexing embeds
+        result = await asyncio.to_thread(weekly_refresh, db.client, agencies)
+        db.clear_search_cache()
         return JSONResponse(content={
             "status": "success" if result.get('success') else "error",
             "data": result
@@ -388,7 +393,7 @@ async def full_refresh(
     except ImportError:
         # Just generate without indexing
         generator = get_generator()
-        result = generator.generate()
+        result = await asyncio.to_thread(generator.generate)
         return JSONResponse(content={
             "status": "success" if result.get('success') else "error",
             "data": result,
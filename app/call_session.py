@@ -73,14 +73,19 @@ class CallSessionManager:
         self._sessions: Dict[str, CallSession] = {}
         self._lock = asyncio.Lock()
     
-    async def create_session(self, agent_phone: str, client_context: dict = None) -> CallSession:
-        """Create a new call session"""
+    async def create_session(self, agent_phone: str, client_context: dict = None, **fields) -> CallSession:
+        """
+        Create a new call session.
+        Extra CallSession fields (status, agent_call_sid, ...) can be set here
+        to avoid a follow-up update_session round-trip + broadcast.
+        """
         session_id = str(uuid.uuid4())[:8]
         
         session = CallSession(
             session_id=session_id,
             agent_phone=agent_phone,
-            client_context=client_context
+            client_context=client_context,
+            **fields
         )
         
         async with self._lock:
@@ -46,6 +46,9 @@ class Settings(BaseSettings):
     chunk_size: int = 500
     chunk_overlap: int = 50
     top_k_results: int = 5
+    chroma_batch_size: int = Field(default=128, ge=1)  # Chunks per ChromaDB add() call (env: CHROMA_BATCH_SIZE)
+    search_cache_size: int = 512  # Cached search() results (0 disables)
+    search_cache_ttl: int = 300  # Seconds before a cached search result expires
     
     class Config:
         env_file = ".env"
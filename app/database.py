@@ -154,6 +154,37 @@ def is_db_configured() -> bool:
 
 # ============ USAGE LOGGING FUNCTIONS ============
 
+def _build_usage_log(
+    service: str,
+    operation: str,
+    quantity: float,
+    unit: str,
+    estimated_cost: float = 0,
+    agency_code: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    metadata: Optional[Dict] = None,
+    timestamp: Optional[datetime] = None,
+    **metadata_fields
+) -> UsageLog:
+    """Build a UsageLog row - extra keyword arguments are stored as metadata"""
+    if metadata_fields:
+        metadata = {**metadata, **metadata_fields} if metadata else metadata_fields
+    
+    return UsageLog(
+        timestamp=timestamp or datetime.utcnow(),
+        agency_code=agency_code,
+        agent_id=agent_id,
+        session_id=session_id,
+        service=service,
+        operation=operation,
+        quantity=quantity,
+        unit=unit,
+        estimated_cost=estimated_cost,
+        metadata_json=json.dumps(metadata) if metadata else None
+    )
+
+
 def log_usage(
     service: str,
     operation: str,
@@ -163,28 +194,29 @@ def log_usage(
     agency_code: Optional[str] = None,
     agent_id: Optional[str] = None,
     session_id: Optional[str] = None,
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = None,
+    **metadata_fields
 ):
     """
     Log a usage event to the database.
     Call this from anywhere in the app when making API calls.
+    
+    Extra keyword arguments are stored as metadata - the dict is only
+    assembled and serialized when the row is actually written.
     """
     if not is_db_configured():
         return None
     
     try:
         with get_db() as db:
-            log_entry = UsageLog(
-                timestamp=datetime.utcnow(),
+            log_entry = _build_usage_log(
+                service, operation, quantity, unit,
+                estimated_cost=estimated_cost,
                 agency_code=agency_code,
                 agent_id=agent_id,
                 session_id=session_id,
-                service=service,
-                operation=operation,
-                quantity=quantity,
-                unit=unit,
-                estimated_cost=estimated_cost,
-                metadata_json=json.dumps(metadata) if metadata else None
+                metadata=metadata,
+                **metadata_fields
             )
             db.add(log_entry)
             return log_entry.id
@@ -193,6 +225,22 @@ def log_usage(
         return None
 
 
+def log_usage_bulk(records: List[Dict[str, Any]]) -> int:
+    """
+    Insert many usage events in a single transaction.
+    Each record holds log_usage() keyword arguments plus an optional
+    'timestamp' (when the event happened, not when it was flushed).
+    Returns the number of rows written. Database errors are raised (the
+    transaction is rolled back) so the caller can retry the batch.
+    """
+    if not is_db_configured() or not records:
+        return 0
+    
+    with get_db() as db:
+        db.add_all([_build_usage_log(**record) for record in records])
+    return len(records)
+
+
 def get_usage_summary(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
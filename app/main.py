@@ -378,17 +378,18 @@ async def health_check():
 
 @app.get("/api/platform/summary")
 async def platform_summary():
+    # External fetchers block on network I/O - keep them off the event loop
     if not is_db_configured():
         return {
             "internal": {"by_service": {}, "by_agency": {}, "total_cost": 0},
-            "external": fetch_all_external_usage(),
+            "external": await asyncio.to_thread(fetch_all_external_usage),
             "daily_trends": [],
             "totals": {"estimated_monthly": 0, "telnyx_actual": 0},
             "database_configured": False,
             "generated_at": datetime.utcnow().isoformat()
         }
     
-    return get_platform_summary()
+    return await asyncio.to_thread(get_platform_summary)
 
 
 @app.get("/api/platform/usage")
@@ -413,7 +414,7 @@ async def platform_logs(limit: int = 100, agency: Optional[str] = None):
 
 @app.get("/api/platform/external")
 async def platform_external():
-    return fetch_all_external_usage()
+    return await asyncio.to_thread(fetch_all_external_usage)
 
 
 # ============ AGENCY VALIDATION ============
@@ -22,6 +22,7 @@ import asyncio
 import time
 import sys
 import uuid
+from collections import deque
 from typing import Optional, Callable
 from deepgram import DeepgramClient, LiveTranscriptionEvents, LiveOptions
 
@@ -46,6 +47,9 @@ class RealtimeTranscriber:
     # Agent identification window - look for intro in first N seconds
     AGENT_ID_WINDOW_SECONDS = 90.0
     
+    # Max final transcript segments kept for context (oldest dropped first)
+    FULL_TRANSCRIPT_MAX_SEGMENTS = 512
+    
     # Audio format constants for duration calculation
     SAMPLE_RATE = 16000  # 16kHz
     BYTES_PER_SAMPLE = 2  # 16-bit linear PCM = 2 bytes per sample
@@ -112,7 +116,8 @@ class RealtimeTranscriber:
         self._down_close_level = 0  # 0-5, where 5 is the floor
         
         # V5: Full transcript for context-aware routing
-        self._full_transcript = ""  # Accumulates entire call transcript
+        # Ring buffer of final segments - caps per-session memory on long calls
+        self._full_transcript = deque(maxlen=self.FULL_TRANSCRIPT_MAX_SEGMENTS)
         
         # V5: Call recording data (for post-call analysis)
         self._call_recording = {
@@ -320,15 +325,16 @@ class RealtimeTranscriber:
               f"wall={wall_clock_seconds:.1f}s, "
               f"agency={self._agency}", flush=True)
         
-        # Log to database for billing
-        cost = log_deepgram_usage(
+        # Log to database for billing - only queues the record (batched write
+        # thread), so stop() can close the Deepgram connection right away
+        log_deepgram_usage(
             duration_seconds=self._audio_duration_seconds,
             agency_code=self._agency,
             session_id=self._session_id,
             model='nova-2'
         )
         
-        print(f"[RT] Logged Deepgram usage: {self._audio_duration_seconds:.1f}s = ${cost:.4f}", flush=True)
+        print(f"[RT] Queued Deepgram usage log: {self._audio_duration_seconds:.1f}s", flush=True)
     
     def _schedule_async(self, coro):
         """Schedule a coroutine to run in the main event loop (thread-safe)"""
@@ -381,7 +387,7 @@ class RealtimeTranscriber:
                         # Buffer final transcripts for context
                         if is_final:
                             self.transcript_buffer += " " + transcript
-                            self._full_transcript += " " + transcript  # V5: Accumulate full transcript
+                            self._full_transcript.append(transcript)  # V5: Accumulate full transcript
                             # Feed to state machine for full tracking
                             if self.state_machine:
                                 self.state_machine.add_transcript(transcript, is_final=True)
@@ -624,7 +630,7 @@ class RealtimeTranscriber:
             
             # ============ PRESENTATIONS: ALWAYS USE AI ============
             # AI builds on scripts - that's what makes this tool elite
-            transcript_length = len(self._full_transcript.strip())
+            transcript_length = len(self._get_full_transcript())
             
             print(f"[RT] 🤖 AI MODE - Building response with {transcript_length} chars context", flush=True)
             
@@ -679,7 +685,7 @@ class RealtimeTranscriber:
         
         try:
             # Use full transcript for better context
-            transcript = self._full_transcript.strip()
+            transcript = self._get_full_transcript()
             
             # Fallback to buffer if full transcript empty
             if not transcript:
@@ -1058,6 +1064,10 @@ Based on the conversation so far, give the agent EXACTLY what to say to present
             "transcript_buffer_words": len(self.transcript_buffer.split())
         }
     
+    def _get_full_transcript(self) -> str:
+        """Join buffered final segments into a single transcript string"""
+        return " ".join(self._full_transcript).strip()
+    
     def get_call_recording(self) -> dict:
         """
         Get complete call recording data for post-call analysis.
@@ -1071,6 +1081,7 @@ Based on the conversation so far, give the agent EXACTLY what to say to present
         """
         bytes_per_second = self.SAMPLE_RATE * self.BYTES_PER_SAMPLE * self.CHANNELS
         duration = self._total_audio_bytes / bytes_per_second if self._total_audio_bytes > 0 else 0
+        full_transcript = self._get_full_transcript()
         
         return {
             # Identifiers
@@ -1083,8 +1094,8 @@ Based on the conversation so far, give the agent EXACTLY what to say to present
             "started_at": self._session_start_time,
             
             # Full transcript (for phrase mining)
-            "transcript": self._full_transcript.strip(),
-            "transcript_length": len(self._full_transcript),
+            "transcript": full_transcript,
+            "transcript_length": len(full_transcript),
             
             # Detection data
             "objections_detected": self._call_recording["objections_detected"],
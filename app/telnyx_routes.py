@@ -69,6 +69,27 @@ def texml_response(content: str) -> Response:
     return Response(content=content, media_type="application/xml")
 
 
+_PHONE_FORMATTING = str.maketrans("", "", "-() .")
+
+
+def normalize_phone(phone: str) -> str:
+    """
+    Validate and normalize a phone number to E.164 (+15551234567).
+    10-digit numbers are assumed US. Called once at ingress - the canonical
+    number is stored on the session so webhooks never re-parse it.
+    """
+    digits = phone.strip().translate(_PHONE_FORMATTING)
+    if digits.startswith("+"):
+        digits = digits[1:]
+    elif len(digits) == 10:
+        digits = f"1{digits}"
+    
+    if not digits.isdigit() or not 11 <= len(digits) <= 15:
+        raise HTTPException(status_code=400, detail=f"Invalid phone number: {phone}")
+    
+    return f"+{digits}"
+
+
 # ============ API ENDPOINTS (Called by Frontend) ============
 
 @router.post("/start-call")
@@ -80,11 +101,9 @@ async def start_call(data: StartCallRequest):
     if not is_telnyx_configured():
         raise HTTPException(status_code=503, detail="Telnyx not configured")
     
-    # Normalize phone number
-    agent_phone = data.agent_phone
-    if not agent_phone.startswith("+"):
-        digits = agent_phone.replace("-", "").replace(" ", "").replace("(", "").replace(")", "")
-        agent_phone = f"+1{digits}" if len(digits) == 10 else f"+{digits}"
+    # Normalize phone numbers once - session holds the canonical E.164 form
+    agent_phone = normalize_phone(data.agent_phone)
+    client_phone = normalize_phone(data.client_phone) if data.client_phone else None
     
     # Extract client context if provided
     client_context = data.client_context.dict() if data.client_context else None
@@ -101,6 +120,7 @@ async def start_call(data: StartCallRequest):
     
     await session_manager.update_session(
         session.session_id,
+        client_phone=client_phone,
         agent_call_sid=result["call_control_id"],
         status=CallStatus.AGENT_RINGING
     )
@@ -119,11 +139,7 @@ async def dial_client(data: DialClientRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Normalize phone number
-    client_phone = data.client_phone
-    if not client_phone.startswith("+"):
-        digits = client_phone.replace("-", "").replace(" ", "").replace("(", "").replace(")", "")
-        client_phone = f"+1{digits}" if len(digits) == 10 else f"+{digits}"
+    client_phone = normalize_phone(data.client_phone)
     
     result = add_client_to_conference(client_phone, data.session_id, data.agent_caller_id)
     
@@ -153,6 +169,7 @@ async def end_call(data: EndCallRequest):
         agent_duration = getattr(session, 'agent_duration', None) or duration
         client_duration = getattr(session, 'client_duration', None) or duration
         
+        # Queued for the batched usage writer, so teardown doesn't wait on the DB
         log_telnyx_usage(
             call_duration_seconds=duration,
             agency_code=getattr(session, 'agency_code', None),
@@ -202,16 +219,14 @@ async def incoming_call(request: Request):
         
         logger.info(f"Incoming call from {caller}")
         
-        # Create a session for this inbound call
-        session = await session_manager.create_session(caller)
-        session_id = session.session_id
-        
-        await session_manager.update_session(
-            session_id,
+        # Create the session already connected - one write instead of create + update
+        session = await session_manager.create_session(
+            caller,
             agent_call_sid=call_sid,
             status=CallStatus.AGENT_CONNECTED,
             started_at=datetime.utcnow()
         )
+        session_id = session.session_id
         
         # Return TeXML to put caller in conference with streaming
         texml = generate_inbound_texml(session_id)
@@ -8,9 +8,10 @@ Claude sees BOTH sides, decides when guidance is needed.
 """
 
 import asyncio
-import base64
+import binascii
 import time
 import audioop
+from collections import deque
 from typing import Dict, Optional
 from dataclasses import dataclass, field
 
@@ -34,7 +35,7 @@ _conversation_buffers: Dict[str, 'ConversationBuffer'] = {}
 class ConversationBuffer:
     """Holds the full conversation for Claude context"""
     session_id: str
-    turns: list = field(default_factory=list)
+    turns: deque = field(default_factory=lambda: deque(maxlen=50))  # Keep last 50 turns max
     agent_name: str = ""
     client_name: str = ""
     agency: str = ""
@@ -46,9 +47,6 @@ class ConversationBuffer:
             "text": text,
             "timestamp": time.time()
         })
-        # Keep last 50 turns max
-        if len(self.turns) > 50:
-            self.turns = self.turns[-50:]
     
     def get_context(self, max_chars: int = 3000) -> str:
         """Get formatted conversation for Claude"""
@@ -64,7 +62,7 @@ class ConversationBuffer:
     
     def get_full_transcript(self) -> list:
         """Get full transcript for post-call analysis"""
-        return self.turns.copy()
+        return list(self.turns)
 
 
 def get_conversation_buffer(session_id: str) -> ConversationBuffer:
@@ -395,7 +393,8 @@ class AgentStreamHandler:
             
             if payload:
                 try:
-                    ulaw_audio = base64.b64decode(payload)
+                    # a2b_base64 skips b64decode's Python-level wrapper (~50 frames/sec/stream)
+                    ulaw_audio = binascii.a2b_base64(payload)
                     self._total_audio_bytes += len(ulaw_audio)
                     pcm_audio = audioop.ulaw2lin(ulaw_audio, 2)
                     
@@ -444,6 +443,8 @@ class AgentStreamHandler:
         print(f"[AgentStream] Stopping {self.session_id}", flush=True)
         self.is_running = False
         
+        # Only queues the record (batched write thread), so connection.finish()
+        # isn't delayed by the DB (the Deepgram socket bills until it's closed)
         if self._total_audio_bytes > 0 and self._session_start_time:
             bytes_per_second = self.SAMPLE_RATE * 2
             duration_seconds = self._total_audio_bytes / bytes_per_second
@@ -564,7 +565,8 @@ class ClientStreamHandler:
             
             if payload:
                 try:
-                    ulaw_audio = base64.b64decode(payload)
+                    # a2b_base64 skips b64decode's Python-level wrapper (~50 frames/sec/stream)
+                    ulaw_audio = binascii.a2b_base64(payload)
                     self._total_audio_bytes += len(ulaw_audio)
                     pcm_audio = audioop.ulaw2lin(ulaw_audio, 2)
                     
@@ -676,6 +678,8 @@ class ClientStreamHandler:
         print(f"[ClientStream] Stopping {self.session_id}", flush=True)
         self.is_running = False
         
+        # Only queues the record (batched write thread), so connection.finish()
+        # isn't delayed by the DB (the Deepgram socket bills until it's closed)
         if self._total_audio_bytes > 0 and self._session_start_time:
             bytes_per_second = self.SAMPLE_RATE * 2
             duration_seconds = self._total_audio_bytes / bytes_per_second
@@ -4,13 +4,22 @@ Pulls usage data from external APIs and calculates costs
 """
 
 import os
-import json
-import requests
+import time
+import atexit
+import functools
+import logging
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+from sqlalchemy.exc import OperationalError, InterfaceError
 
-from .database import log_usage, is_db_configured, get_db, ExternalServiceSnapshot
+from .database import log_usage_bulk, is_db_configured, get_db, ExternalServiceSnapshot
+
+logger = logging.getLogger(__name__)
 
 
 # ============ PRICING CONSTANTS ============
@@ -55,11 +64,23 @@ PRICING = {
 }
 
 
+DEFAULT_DEEPGRAM_MODEL = 'nova-2'
+DEFAULT_CLAUDE_MODEL = 'claude-sonnet-4-20250514'
+
+# Flattened rate tables built once at import - the log_* wrappers run on every
+# completion / session, so they do a single dict lookup + multiply
+_CLAUDE_RATES = {
+    model: (rates['input_per_1k'] / 1000.0, rates['output_per_1k'] / 1000.0)
+    for model, rates in PRICING['claude'].items()
+}
+_DEEPGRAM_PER_SEC = {model: rate / 60.0 for model, rate in PRICING['deepgram'].items()}
+
+
 # ============ COST CALCULATION HELPERS ============
 
-def calculate_deepgram_cost(minutes: float, model: str = 'nova-2') -> float:
+def calculate_deepgram_cost(minutes: float, model: str = DEFAULT_DEEPGRAM_MODEL) -> float:
     """Calculate Deepgram transcription cost"""
-    rate = PRICING['deepgram'].get(model, PRICING['deepgram']['nova-2'])
+    rate = PRICING['deepgram'].get(model, PRICING['deepgram'][DEFAULT_DEEPGRAM_MODEL])
     return minutes * rate
 
 
@@ -103,12 +124,27 @@ def calculate_telnyx_cost(
     return call_cost + conference_cost + streaming_cost + recording_cost
 
 
-def calculate_claude_cost(input_tokens: int, output_tokens: int, model: str = 'claude-sonnet-4-20250514') -> float:
+def calculate_claude_cost(input_tokens: int, output_tokens: int, model: str = DEFAULT_CLAUDE_MODEL) -> float:
     """Calculate Claude API cost"""
-    model_pricing = PRICING['claude'].get(model, PRICING['claude']['claude-sonnet-4-20250514'])
-    input_cost = (input_tokens / 1000) * model_pricing['input_per_1k']
-    output_cost = (output_tokens / 1000) * model_pricing['output_per_1k']
-    return input_cost + output_cost
+    input_rate, output_rate = _CLAUDE_RATES.get(model) or _CLAUDE_RATES[DEFAULT_CLAUDE_MODEL]
+    return input_tokens * input_rate + output_tokens * output_rate
+
+
+SECONDS_TO_MINUTES = 1 / 60.0
+
+# Per-second Telnyx rates, precomputed so log_telnyx_usage multiplies seconds
+# directly instead of converting to minutes first
+_TELNYX_PER_SEC = {
+    key: rate * SECONDS_TO_MINUTES
+    for key, rate in PRICING['telnyx'].items()
+    if 'per_minute' in key
+}
+# Combined call rate (legs + conference + streaming) keyed by (is_inbound, is_dual_channel)
+_TELNYX_CALL_PER_SEC = {
+    (is_inbound, is_dual_channel): calculate_telnyx_cost(1.0, 0, is_inbound, is_dual_channel) * SECONDS_TO_MINUTES
+    for is_inbound in (False, True)
+    for is_dual_channel in (False, True)
+}
 
 
 def get_dual_channel_cost_breakdown(call_minutes: float) -> Dict[str, float]:
@@ -133,7 +169,7 @@ def get_dual_channel_cost_breakdown(call_minutes: float) -> Dict[str, float]:
     telnyx_total = call_legs + conference + streaming
     
     # Add Deepgram cost (both channels transcribed)
-    deepgram_cost = call_minutes * PRICING['deepgram']['nova-2'] * 2
+    deepgram_cost = call_minutes * PRICING['deepgram'][DEFAULT_DEEPGRAM_MODEL] * 2
     
     # Estimate Claude cost (~1 analysis per minute, ~500 input + 100 output tokens each)
     claude_analyses = call_minutes  # roughly 1 per minute
@@ -156,6 +192,131 @@ def get_dual_channel_cost_breakdown(call_minutes: float) -> Dict[str, float]:
     }
 
 
+# ============ USAGE WRITE QUEUE ============
+# log_*_usage wrappers enqueue records; a background thread writes them in
+# batches (every USAGE_FLUSH_INTERVAL seconds or USAGE_FLUSH_BATCH records),
+# so hot paths like per-turn Claude completions don't each cost a DB commit.
+
+USAGE_FLUSH_INTERVAL = 1.0  # seconds
+USAGE_FLUSH_BATCH = 100
+USAGE_FLUSH_MAX_RETRIES = 30  # Consecutive failed flushes (~30s of outage) before a batch is dropped
+USAGE_QUEUE_MAX = 10000  # Records held while the DB is unavailable
+# Connection-level errors: the batch is fine, the database isn't reachable
+_DB_UNAVAILABLE_ERRORS = (OperationalError, InterfaceError)
+
+_USAGE_QUEUE: deque = deque()
+_usage_flush_event = threading.Event()
+_usage_flusher_lock = threading.Lock()
+_usage_flusher_pid: Optional[int] = None
+_usage_flush_failures = 0
+
+
+def _usage_flush_loop():
+    """Background writer - drains the queue until the process exits"""
+    while True:
+        _usage_flush_event.wait(USAGE_FLUSH_INTERVAL)
+        _usage_flush_event.clear()
+        try:
+            flush_usage_queue()
+        except Exception:
+            logger.exception("Usage flush loop error")
+
+
+def _ensure_usage_flusher():
+    """Start the flush thread on first use (per process, so it survives forking servers)"""
+    global _usage_flusher_pid
+    if _usage_flusher_pid == os.getpid():
+        return
+    with _usage_flusher_lock:
+        if _usage_flusher_pid != os.getpid():
+            threading.Thread(target=_usage_flush_loop, name="usage-flush", daemon=True).start()
+            _usage_flusher_pid = os.getpid()
+
+
+def _enqueue_usage(**record):
+    """Queue a usage record (log_usage kwargs) for the next batch write"""
+    if not is_db_configured():
+        return
+    
+    record['timestamp'] = datetime.utcnow()
+    _USAGE_QUEUE.append(record)
+    _ensure_usage_flusher()
+    if len(_USAGE_QUEUE) >= USAGE_FLUSH_BATCH:
+        _usage_flush_event.set()
+
+
+def _requeue_usage(records: list):
+    """
+    Put an unwritten batch back at the front of the queue after a connection
+    failure (call from an except block). After USAGE_FLUSH_MAX_RETRIES
+    consecutive failures, or beyond USAGE_QUEUE_MAX records, records are
+    dropped and the loss is logged.
+    """
+    global _usage_flush_failures
+    _usage_flush_failures += 1
+    if _usage_flush_failures >= USAGE_FLUSH_MAX_RETRIES:
+        logger.exception(
+            "Usage flush failed %d times in a row; dropped %d usage records",
+            _usage_flush_failures, len(records)
+        )
+        _usage_flush_failures = 0
+        return
+    
+    logger.exception(
+        "Usage flush failed (attempt %d/%d); re-queued %d usage records",
+        _usage_flush_failures, USAGE_FLUSH_MAX_RETRIES, len(records)
+    )
+    _USAGE_QUEUE.extendleft(reversed(records))
+    overflow = len(_USAGE_QUEUE) - USAGE_QUEUE_MAX
+    if overflow > 0:
+        # Keep the newest records; drop the oldest
+        for _ in range(overflow):
+            _USAGE_QUEUE.popleft()
+        logger.error("Usage queue over %d records; dropped %d oldest", USAGE_QUEUE_MAX, overflow)
+
+
+def flush_usage_queue() -> int:
+    """
+    Write all queued usage records in one transaction. Returns rows written.
+    If the database is unreachable the batch is re-queued (see _requeue_usage).
+    Any other error means a record in the batch can't be written, so the batch
+    is retried record by record and only the failing records are dropped.
+    """
+    global _usage_flush_failures
+    records = []
+    while True:
+        try:
+            records.append(_USAGE_QUEUE.popleft())
+        except IndexError:
+            break
+    if not records:
+        return 0
+    
+    try:
+        written = log_usage_bulk(records)
+    except _DB_UNAVAILABLE_ERRORS:
+        _requeue_usage(records)
+        return 0
+    except Exception:
+        # e.g. unserialisable metadata: isolate the bad record(s), keep the rest
+        written = 0
+        for i, record in enumerate(records):
+            try:
+                written += log_usage_bulk([record])
+            except _DB_UNAVAILABLE_ERRORS:
+                _requeue_usage(records[i:])
+                return written
+            except Exception:
+                logger.exception("Dropped usage record that can't be written: %r", record)
+    
+    _usage_flush_failures = 0
+    return written
+
+
+# Don't lose the last partial batch on shutdown
+atexit.register(flush_usage_queue)
+
+
 # ============ LOGGING WRAPPERS ============
 # Use these throughout the app to automatically track usage
 
@@ -163,21 +324,22 @@ def log_deepgram_usage(
     duration_seconds: float,
     agency_code: Optional[str] = None,
     session_id: Optional[str] = None,
-    model: str = 'nova-2'
+    model: str = DEFAULT_DEEPGRAM_MODEL
 ):
     """Log Deepgram transcription usage"""
-    minutes = duration_seconds / 60
-    cost = calculate_deepgram_cost(minutes, model)
+    per_second = _DEEPGRAM_PER_SEC.get(model) or _DEEPGRAM_PER_SEC[DEFAULT_DEEPGRAM_MODEL]
+    cost = duration_seconds * per_second
     
-    log_usage(
+    _enqueue_usage(
         service='deepgram',
         operation='transcribe',
-        quantity=minutes,
+        quantity=duration_seconds / 60,
         unit='minutes',
         estimated_cost=cost,
         agency_code=agency_code,
         session_id=session_id,
-        metadata={'model': model, 'seconds': duration_seconds}
+        model=model,
+        seconds=duration_seconds
     )
     
     return cost
@@ -200,23 +362,21 @@ def log_telnyx_usage(
     For accurate tracking, pass agent_duration_seconds and client_duration_seconds
     separately. If not provided, assumes both legs = call_duration_seconds.
     """
-    call_minutes = call_duration_seconds / 60
-    recording_minutes = recording_seconds / 60
-    
-    # Calculate accurate cost
-    cost = calculate_telnyx_cost(
-        call_minutes, 
-        recording_minutes, 
-        is_inbound,
-        is_dual_channel=is_dual_channel,
-        has_media_streaming=True
+    per_sec = _TELNYX_PER_SEC
+    call_minutes = call_duration_seconds * SECONDS_TO_MINUTES
+    recording_minutes = recording_seconds * SECONDS_TO_MINUTES
+    
+    # Same result as calculate_telnyx_cost(), computed straight from seconds
+    cost = (
+        call_duration_seconds * _TELNYX_CALL_PER_SEC[(bool(is_inbound), bool(is_dual_channel))]
+        + recording_seconds * per_sec['recording_per_minute']
     )
     
     # Track both legs if provided
-    agent_mins = (agent_duration_seconds / 60) if agent_duration_seconds else call_minutes
-    client_mins = (client_duration_seconds / 60) if client_duration_seconds else call_minutes
+    agent_mins = (agent_duration_seconds * SECONDS_TO_MINUTES) if agent_duration_seconds else call_minutes
+    client_mins = (client_duration_seconds * SECONDS_TO_MINUTES) if client_duration_seconds else call_minutes
     
-    log_usage(
+    _enqueue_usage(
         service='telnyx',
         operation='dual_channel_call' if is_dual_channel else 'call',
         quantity=call_minutes,
@@ -224,19 +384,17 @@ def log_telnyx_usage(
         estimated_cost=cost,
         agency_code=agency_code,
         session_id=session_id,
-        metadata={
-            'call_control_id': call_control_id,
-            'recording_minutes': recording_minutes,
-            'is_inbound': is_inbound,
-            'is_dual_channel': is_dual_channel,
-            'agent_minutes': round(agent_mins, 2),
-            'client_minutes': round(client_mins, 2),
-            'cost_breakdown': {
-                'call_legs': round(call_minutes * PRICING['telnyx']['call_per_minute_outbound'] * 2, 4),
-                'conference': round(call_minutes * PRICING['telnyx']['conference_per_minute_per_participant'] * 2, 4),
-                'streaming': round(call_minutes * PRICING['telnyx']['media_streaming_per_minute'] * 2, 4),
-                'recording': round(recording_minutes * PRICING['telnyx']['recording_per_minute'], 4)
-            }
+        call_control_id=call_control_id,
+        recording_minutes=recording_minutes,
+        is_inbound=is_inbound,
+        is_dual_channel=is_dual_channel,
+        agent_minutes=round(agent_mins, 2),
+        client_minutes=round(client_mins, 2),
+        cost_breakdown={
+            'call_legs': round(call_duration_seconds * per_sec['call_per_minute_outbound'] * 2, 4),
+            'conference': round(call_duration_seconds * per_sec['conference_per_minute_per_participant'] * 2, 4),
+            'streaming': round(call_duration_seconds * per_sec['media_streaming_per_minute'] * 2, 4),
+            'recording': round(recording_seconds * per_sec['recording_per_minute'], 4)
         }
     )
     
@@ -248,14 +406,14 @@ def log_claude_usage(
     output_tokens: int,
     agency_code: Optional[str] = None,
     session_id: Optional[str] = None,
-    model: str = 'claude-sonnet-4-20250514',
+    model: str = DEFAULT_CLAUDE_MODEL,
     operation: str = 'completion'
 ):
     """Log Claude API usage"""
     cost = calculate_claude_cost(input_tokens, output_tokens, model)
     total_tokens = input_tokens + output_tokens
     
-    log_usage(
+    _enqueue_usage(
         service='claude',
         operation=operation,
         quantity=total_tokens,
@@ -263,11 +421,9 @@ def log_claude_usage(
         estimated_cost=cost,
         agency_code=agency_code,
         session_id=session_id,
-        metadata={
-            'model': model,
-            'input_tokens': input_tokens,
-            'output_tokens': output_tokens
-        }
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens
     )
     
     return cost
@@ -275,23 +431,113 @@ def log_claude_usage(
 
 # ============ EXTERNAL API FETCHERS ============
 
+# Shared keep-alive session - repeat calls to the same provider host reuse
+# the TCP+TLS connection instead of handshaking on every request.
+# Built on first fetch, so processes that only log costs never import requests.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Get (or lazily create) the shared requests.Session for provider APIs"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+                # Provider payloads (call events, 30-day bandwidth arrays) are large JSON - always ask for compression
+                session.headers['Accept-Encoding'] = 'gzip, deflate'
+                _http_session = session
+    return _http_session
+
+
+def _parse_json(response) -> Any:
+    """Parse a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to a JSON string with orjson"""
+    return orjson.dumps(data).decode()
+
+
+# In-memory fetcher cache: key -> (monotonic timestamp, payload)
+_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+_refreshing: set = set()
+
+
+def ttl_cache(seconds: float = 60, stale_seconds: float = 600):
+    """
+    Cache a zero-arg fetcher's result with stale-while-revalidate semantics.
+    Balances and monthly usage move on the order of minutes, so dashboard
+    loads shouldn't re-hit provider APIs every time.
+    
+    - age < seconds: served from cache
+    - age < stale_seconds: served from cache, refreshed in a background thread
+    - otherwise: fetched synchronously
+    Error payloads are never cached, so an outage keeps serving the last good data.
+    """
+    def decorator(fn):
+        key = fn.__name__
+        
+        def refresh() -> Dict[str, Any]:
+            result = fn()
+            if 'error' not in result:
+                with _cache_lock:
+                    _CACHE[key] = (time.monotonic(), result)
+            return result
+        
+        def background_refresh():
+            try:
+                refresh()
+            except Exception as e:
+                print(f"Background refresh of {key} failed: {e}")
+            finally:
+                with _cache_lock:
+                    _refreshing.discard(key)
+        
+        @functools.wraps(fn)
+        def wrapper() -> Dict[str, Any]:
+            entry = _CACHE.get(key)
+            if entry:
+                age = time.monotonic() - entry[0]
+                if age < seconds:
+                    return entry[1]
+                if age < stale_seconds:
+                    with _cache_lock:
+                        should_refresh = key not in _refreshing
+                        _refreshing.add(key)
+                    if should_refresh:
+                        threading.Thread(target=background_refresh, daemon=True).start()
+                    return entry[1]
+            return refresh()
+        
+        return wrapper
+    return decorator
+
+
+# Anthropic doesn't expose a usage API publicly yet - static part of the placeholder
+_ANTHROPIC_PLACEHOLDER = MappingProxyType({
+    'source': 'internal_tracking',
+    'note': 'Anthropic usage tracked via internal logging',
+})
+
+
 def fetch_anthropic_usage() -> Dict[str, Any]:
     """
     Fetch usage from Anthropic API
     Note: Anthropic doesn't have a public usage API yet,
     so we rely on our internal logging. This is a placeholder.
     """
-    api_key = os.getenv('ANTHROPIC_API_KEY', '')
-    
-    # Anthropic doesn't expose a usage API publicly yet
-    # Return empty dict - we track usage internally
-    return {
-        'source': 'internal_tracking',
-        'note': 'Anthropic usage tracked via internal logging',
-        'fetched_at': datetime.utcnow().isoformat()
-    }
+    return {**_ANTHROPIC_PLACEHOLDER, 'fetched_at_unix': time.time()}
 
 
+@ttl_cache(seconds=60)
 def fetch_deepgram_usage() -> Dict[str, Any]:
     """
     Fetch usage from Deepgram API
@@ -310,7 +556,7 @@ def fetch_deepgram_usage() -> Dict[str, Any]:
         }
         
         # First get projects
-        projects_response = requests.get(
+        projects_response = _get_http_session().get(
             'https://api.deepgram.com/v1/projects',
             headers=headers,
             timeout=10
@@ -319,7 +565,7 @@ def fetch_deepgram_usage() -> Dict[str, Any]:
         if projects_response.status_code != 200:
             return {'error': f'Failed to fetch projects: {projects_response.status_code}'}
         
-        projects_data = projects_response.json()
+        projects_data = _parse_json(projects_response)
         projects = projects_data.get('projects', [])
         
         if not projects:
@@ -328,46 +574,99 @@ def fetch_deepgram_usage() -> Dict[str, Any]:
         # Get usage for first project
         project_id = projects[0]['project_id']
         
-        # Get balances
-        balances_response = requests.get(
-            f'https://api.deepgram.com/v1/projects/{project_id}/balances',
-            headers=headers,
-            timeout=10
-        )
-        
-        balances_data = {}
-        if balances_response.status_code == 200:
-            balances_data = balances_response.json()
-        
-        # Get usage summary (last 30 days)
+        # Usage summary window (last 30 days)
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=30)
         
-        usage_response = requests.get(
-            f'https://api.deepgram.com/v1/projects/{project_id}/usage',
-            headers=headers,
-            params={
-                'start': start_date.strftime('%Y-%m-%d'),
-                'end': end_date.strftime('%Y-%m-%d')
-            },
-            timeout=10
-        )
+        # Balances and usage only depend on project_id - fetch them concurrently
+        http = _get_http_session()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            balances_future = executor.submit(
+                http.get,
+                f'https://api.deepgram.com/v1/projects/{project_id}/balances',
+                headers=headers,
+                timeout=10
+            )
+            usage_future = executor.submit(
+                http.get,
+                f'https://api.deepgram.com/v1/projects/{project_id}/usage',
+                headers=headers,
+                params={
+                    'start': start_date.strftime('%Y-%m-%d'),
+                    'end': end_date.strftime('%Y-%m-%d')
+                },
+                timeout=10
+            )
+            balances_response = balances_future.result()
+            usage_response = usage_future.result()
+        
+        balances_data = {}
+        if balances_response.status_code == 200:
+            balances_data = _parse_json(balances_response)
         
         usage_data = {}
         if usage_response.status_code == 200:
-            usage_data = usage_response.json()
+            usage_data = _parse_json(usage_response)
         
         return {
             'project_id': project_id,
             'balances': balances_data,
             'usage_30d': usage_data,
-            'fetched_at': datetime.utcnow().isoformat()
+            'fetched_at_unix': time.time()
         }
         
     except Exception as e:
         return {'error': str(e)}
 
 
+TELNYX_MAX_PAGES = 20
+TELNYX_PAGE_WORKERS = 5
+
+
+def _fetch_telnyx_pages(url: str, headers: Dict[str, str], params: Dict[str, Any], timeout: float = 15) -> Optional[list]:
+    """
+    Fetch every page of a Telnyx list endpoint (capped at TELNYX_MAX_PAGES).
+    Page 1 reports meta.total_pages; pages 2..N are fetched concurrently over
+    the shared session's pool. Returns None if the first page fails.
+    """
+    first_response = _get_http_session().get(url, headers=headers, params=params, timeout=timeout)
+    if first_response.status_code != 200:
+        return None
+    
+    first_page = _parse_json(first_response)
+    items = list(first_page.get('data', []))
+    total_pages = min(first_page.get('meta', {}).get('total_pages') or 1, TELNYX_MAX_PAGES)
+    if total_pages <= 1:
+        return items
+    
+    def fetch_page(page_number: int) -> list:
+        try:
+            response = _get_http_session().get(
+                url,
+                headers=headers,
+                params={**params, 'page[number]': page_number},
+                timeout=timeout
+            )
+            if response.status_code == 200:
+                return _parse_json(response).get('data', [])
+        except Exception:
+            pass
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(TELNYX_PAGE_WORKERS, total_pages - 1)) as executor:
+        for page in executor.map(fetch_page, range(2, total_pages + 1)):
+            items.extend(page)
+    
+    return items
+
+
+def _hangup_duration_secs(event: Dict[str, Any]) -> float:
+    """Billable seconds from a Telnyx call.hangup event"""
+    payload = event.get('payload', {})
+    return payload.get('duration_secs', 0) or payload.get('billsec', 0)
+
+
+@ttl_cache(seconds=60)
 def fetch_telnyx_usage() -> Dict[str, Any]:
     """
     Fetch usage from Telnyx API with accurate cost tracking
@@ -386,9 +685,12 @@ def fetch_telnyx_usage() -> Dict[str, Any]:
         
         end_date = datetime.utcnow()
         start_date = end_date.replace(day=1)  # First of month
+        # Format the window once - reused by several filters and the summary
+        start_day = start_date.strftime('%Y-%m-%d')
+        end_day = end_date.strftime('%Y-%m-%d')
         
         # 1. Get account balance (shows actual spend)
-        balance_response = requests.get(
+        balance_response = _get_http_session().get(
             'https://api.telnyx.com/v2/balance',
             headers=headers,
             timeout=10
@@ -397,11 +699,11 @@ def fetch_telnyx_usage() -> Dict[str, Any]:
         balance_data = {}
         account_balance = None
         if balance_response.status_code == 200:
-            balance_data = balance_response.json()
+            balance_data = _parse_json(balance_response)
             account_balance = balance_data.get('data', {}).get('balance')
         
         # 2. Get phone numbers
-        numbers_response = requests.get(
+        numbers_response = _get_http_session().get(
             'https://api.telnyx.com/v2/phone_numbers',
             headers=headers,
             params={'page[size]': 100},
@@ -410,55 +712,42 @@ def fetch_telnyx_usage() -> Dict[str, Any]:
         
         phone_numbers = []
         if numbers_response.status_code == 200:
-            numbers_data = numbers_response.json()
+            numbers_data = _parse_json(numbers_response)
             phone_numbers = numbers_data.get('data', [])
         
-        # 3. Get call events for actual usage
+        # 3. Get call events for actual usage (all pages for the month)
         # Using call_events gives us more detail than /calls
-        calls_response = requests.get(
+        call_events = _fetch_telnyx_pages(
             'https://api.telnyx.com/v2/call_events',
-            headers=headers,
-            params={
+            headers,
+            {
                 'page[size]': 250,
                 'filter[event_type]': 'call.hangup',
                 'filter[occurred_at][gte]': start_date.isoformat() + 'Z',
                 'filter[occurred_at][lte]': end_date.isoformat() + 'Z'
-            },
-            timeout=15
-        )
-        
-        call_events = []
-        total_call_seconds = 0
-        call_count = 0
-        
-        if calls_response.status_code == 200:
-            events_data = calls_response.json()
-            call_events = events_data.get('data', [])
-            
-            for event in call_events:
-                payload = event.get('payload', {})
-                # Duration in seconds from hangup events
-                duration = payload.get('duration_secs', 0) or payload.get('billsec', 0)
-                if duration:
-                    total_call_seconds += duration
-                    call_count += 1
+            }
+        ) or []
         
-        total_call_minutes = total_call_seconds / 60
+        # Duration in seconds from hangup events - only calls with a duration count
+        durations = [d for d in map(_hangup_duration_secs, call_events) if d]
+        total_call_seconds = sum(durations)
+        call_count = len(durations)
+        total_call_minutes = total_call_seconds / 60.0
         
         # 4. Try to get billing/usage report (if available)
         billing_data = {}
         try:
-            billing_response = requests.get(
+            billing_response = _get_http_session().get(
                 'https://api.telnyx.com/v2/billing/group_costs',
                 headers=headers,
                 params={
-                    'filter[date][gte]': start_date.strftime('%Y-%m-%d'),
-                    'filter[date][lte]': end_date.strftime('%Y-%m-%d')
+                    'filter[date][gte]': start_day,
+                    'filter[date][lte]': end_day
                 },
                 timeout=15
             )
             if billing_response.status_code == 200:
-                billing_data = billing_response.json()
+                billing_data = _parse_json(billing_response)
         except:
             pass  # Billing API may not be available on all accounts
         
@@ -487,7 +776,7 @@ def fetch_telnyx_usage() -> Dict[str, Any]:
             )
         
         return {
-            'period': f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+            'period': f"{start_day} to {end_day}",
             'account_balance': account_balance,
             'phone_numbers_count': len(phone_numbers),
             'phone_numbers': [n.get('phone_number') for n in phone_numbers[:5]],  # First 5
@@ -504,13 +793,36 @@ def fetch_telnyx_usage() -> Dict[str, Any]:
                 'total_cost': round(actual_cost if actual_cost else (phone_number_monthly_cost + estimated_call_cost), 4)
             },
             'has_actual_billing': actual_cost is not None,
-            'fetched_at': datetime.utcnow().isoformat()
+            'fetched_at_unix': time.time()
         }
         
     except Exception as e:
         return {'error': str(e)}
 
 
+RENDER_BANDWIDTH_WORKERS = 10
+RENDER_PAGE_SIZE = 100
+RENDER_SUSPENDED_STATUSES = ('suspended', True)
+RENDER_MAX_PAGES = 10
+
+
+def _fetch_render_bandwidth(service_id: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Fetch 30-day bandwidth for one Render service, None on failure"""
+    try:
+        bw_response = _get_http_session().get(
+            f"https://api.render.com/v1/services/{service_id}/metrics/bandwidth",
+            headers=headers,
+            params={'resolution': 'day', 'numPeriods': 30},
+            timeout=10
+        )
+        if bw_response.status_code == 200:
+            return _parse_json(bw_response)
+    except Exception:
+        pass
+    return None
+
+
+@ttl_cache(seconds=60)
 def fetch_render_usage() -> Dict[str, Any]:
     """
     Fetch usage from Render API
@@ -527,18 +839,34 @@ def fetch_render_usage() -> Dict[str, Any]:
             'Accept': 'application/json'
         }
         
-        # Get services
-        services_response = requests.get(
-            'https://api.render.com/v1/services',
-            headers=headers,
-            params={'limit': 20},
-            timeout=10
-        )
-        
-        if services_response.status_code != 200:
-            return {'error': f'Failed to fetch services: {services_response.status_code}'}
+        # Get services - Render paginates by cursor, so pages are sequential
+        services_data = []
+        cursor = None
+        for _ in range(RENDER_MAX_PAGES):
+            params = {'limit': RENDER_PAGE_SIZE}
+            if cursor:
+                params['cursor'] = cursor
+            
+            services_response = _get_http_session().get(
+                'https://api.render.com/v1/services',
+                headers=headers,
+                params=params,
+                timeout=10
+            )
+            
+            if services_response.status_code != 200:
+                if not services_data:
+                    return {'error': f'Failed to fetch services: {services_response.status_code}'}
+                break
+            
+            page = _parse_json(services_response)
+            services_data.extend(page)
+            if len(page) < RENDER_PAGE_SIZE:
+                break
+            cursor = page[-1].get('cursor')
+            if not cursor:
+                break
         
-        services_data = services_response.json()
         services = []
         
         for item in services_data:
@@ -551,39 +879,75 @@ def fetch_render_usage() -> Dict[str, Any]:
                 'created_at': service.get('createdAt')
             })
         
-        # Get bandwidth for each service
-        for svc in services:
-            if svc['id']:
-                try:
-                    bw_response = requests.get(
-                        f"https://api.render.com/v1/services/{svc['id']}/metrics/bandwidth",
-                        headers=headers,
-                        params={'resolution': 'day', 'numPeriods': 30},
-                        timeout=10
-                    )
-                    if bw_response.status_code == 200:
-                        svc['bandwidth'] = bw_response.json()
-                except:
-                    pass
+        # Get bandwidth for each active service - independent requests, so fan out
+        # over the shared session's connection pool instead of one at a time.
+        # Suspended services report no traffic, so skip their round-trip.
+        with_ids = [
+            svc for svc in services
+            if svc['id'] and svc['status'] not in RENDER_SUSPENDED_STATUSES
+        ]
+        if with_ids:
+            with ThreadPoolExecutor(max_workers=min(RENDER_BANDWIDTH_WORKERS, len(with_ids))) as executor:
+                bandwidths = list(executor.map(lambda svc: _fetch_render_bandwidth(svc['id'], headers), with_ids))
+            for svc, bandwidth in zip(with_ids, bandwidths):
+                if bandwidth is not None:
+                    svc['bandwidth'] = bandwidth
         
         return {
             'services': services,
-            'fetched_at': datetime.utcnow().isoformat()
+            'fetched_at_unix': time.time()
         }
         
     except Exception as e:
         return {'error': str(e)}
 
 
+def _with_iso_timestamp(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add an ISO 'fetched_at' for API consumers. Fetchers only stamp a unix
+    float; formatting happens once here at the boundary. Returns a copy so
+    cached payloads aren't mutated.
+    """
+    fetched_at_unix = payload.get('fetched_at_unix')
+    if fetched_at_unix is None:
+        return payload
+    return {**payload, 'fetched_at': datetime.utcfromtimestamp(fetched_at_unix).isoformat()}
+
+
 def fetch_all_external_usage() -> Dict[str, Any]:
-    """Fetch usage from all external services"""
-    return {
-        'anthropic': fetch_anthropic_usage(),
-        'deepgram': fetch_deepgram_usage(),
-        'telnyx': fetch_telnyx_usage(),
-        'render': fetch_render_usage(),
-        'fetched_at': datetime.utcnow().isoformat()
+    """
+    Fetch usage from all external services.
+    Fetchers are pure network I/O, so they run concurrently - wall time is
+    the slowest provider rather than the sum of all of them.
+    """
+    fetchers = {
+        'anthropic': fetch_anthropic_usage,
+        'deepgram': fetch_deepgram_usage,
+        'telnyx': fetch_telnyx_usage,
+        'render': fetch_render_usage,
     }
+    
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {name: executor.submit(fn) for name, fn in fetchers.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = _with_iso_timestamp(future.result())
+        except Exception as e:
+            results[name] = {'error': str(e)}
+    
+    results['fetched_at'] = datetime.utcnow().isoformat()
+    return results
+
+
+def _build_snapshot(service: str, data: Dict[str, Any]) -> ExternalServiceSnapshot:
+    """Build an ExternalServiceSnapshot row from a fetcher payload"""
+    return ExternalServiceSnapshot(
+        service=service,
+        data_json=_dumps(data),
+        total_cost=data.get('summary', {}).get('total_cost') if isinstance(data.get('summary'), dict) else None
+    )
 
 
 def save_external_snapshot(service: str, data: Dict[str, Any]):
@@ -593,21 +957,50 @@ def save_external_snapshot(service: str, data: Dict[str, Any]):
     
     try:
         with get_db() as db:
-            snapshot = ExternalServiceSnapshot(
-                service=service,
-                data_json=json.dumps(data),
-                total_cost=data.get('summary', {}).get('total_cost') if isinstance(data.get('summary'), dict) else None
-            )
-            db.add(snapshot)
+            db.add(_build_snapshot(service, data))
     except Exception as e:
         print(f"Failed to save snapshot: {e}")
 
 
+def save_external_snapshots(all_data: Dict[str, Any]):
+    """
+    Save snapshots for several services in a single transaction.
+    Accepts fetch_all_external_usage() output directly - non-dict entries
+    (like the top-level 'fetched_at') are skipped.
+    """
+    if not is_db_configured():
+        return
+    
+    snapshots = [
+        _build_snapshot(service, data)
+        for service, data in all_data.items()
+        if isinstance(data, dict)
+    ]
+    if not snapshots:
+        return
+    
+    try:
+        with get_db() as db:
+            db.add_all(snapshots)
+    except Exception as e:
+        print(f"Failed to save snapshots: {e}")
+
+
+PLATFORM_SUMMARY_TTL = 30  # seconds
+
+
 def get_platform_summary() -> Dict[str, Any]:
     """
     Get complete platform summary for the admin dashboard
     Combines internal tracking with external API data
+    
+    Cached for PLATFORM_SUMMARY_TTL seconds, so dashboard polling from any
+    number of viewers costs one DB + provider fan-out per window.
     """
+    cached = _CACHE.get('platform_summary')
+    if cached and time.monotonic() - cached[0] < PLATFORM_SUMMARY_TTL:
+        return cached[1]
+    
     from .database import get_usage_summary, get_usage_by_agency, get_daily_usage
     
     # Get internal usage data
@@ -629,7 +1022,7 @@ def get_platform_summary() -> Dict[str, Any]:
     if 'telnyx' in external_data and 'summary' in external_data['telnyx']:
         telnyx_external_cost = external_data['telnyx']['summary'].get('total_cost', 0)
     
-    return {
+    result = {
         'internal': {
             'by_service': internal_summary,
             'by_agency': agency_breakdown,
@@ -642,4 +1035,8 @@ def get_platform_summary() -> Dict[str, Any]:
             'telnyx_actual': telnyx_external_cost
         },
         'generated_at': datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+    }
+    
+    with _cache_lock:
+        _CACHE['platform_summary'] = (time.monotonic(), result)
+    return result
@@ -3,14 +3,57 @@ Coachd Vector Database
 ChromaDB integration with agency-scoped collections
 """
 
+import os
+import time
+import functools
+import threading
+import numpy as np
 import chromadb
 from chromadb import Settings as ChromaSettings
-from typing import List, Dict, Any, Optional
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from .document_processor import DocumentChunk
 from .config import settings
 
+# Metadata rows fetched per collection.get() call in list_documents
+LIST_DOCUMENTS_PAGE_SIZE = 1000
+
+# Max agencies ingested concurrently by add_chunks_many
+ADD_CHUNKS_MAX_WORKERS = min(8, max(1, (os.cpu_count() or 4) * 3 // 4))
+
+# Collections at or below this many chunks are searched in memory with NumPy
+SMALL_COLLECTION_THRESHOLD = 2048
+
+# include= field lists, allocated once (chromadb 0.5 requires lists, not tuples;
+# treat these as read-only)
+_QUERY_INCLUDE = ["documents", "metadatas", "distances"]
+_MATRIX_INCLUDE = ["embeddings", "documents", "metadatas"]
+_META_INCLUDE = ["metadatas"]
+_IDS_ONLY_INCLUDE: list = []
+
+AGENCY_PREFIX = "agency_"
+AGENCY_PREFIX_LEN = len(AGENCY_PREFIX)
+
+# Agency name -> collection-safe name, in one pass
+_AGENCY_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+# The one embedder for every collection this process opens (the ONNX model loads
+# on first use, so sharing it keeps a single copy in memory). Passed to every
+# get_or_create_collection call and used directly by the small-collection fast path.
+EMBEDDING_FUNCTION = DefaultEmbeddingFunction()
+
+
+@functools.lru_cache(maxsize=256)
+def _collection_name_for(agency: Optional[str]) -> str:
+    """Collection name for an agency (cached; the tenant set is small)"""
+    if agency:
+        return AGENCY_PREFIX + agency.lower().translate(_AGENCY_NAME_TRANS)
+    return "coachd_shared"
+
 
 class VectorDatabase:
     """Manages document embeddings and semantic search using ChromaDB"""
@@ -27,48 +70,104 @@ class VectorDatabase:
             settings=ChromaSettings(anonymized_telemetry=False)
         )
         
+        # Collection handles by name, so hot paths skip get_or_create
+        self._collections: Dict[str, Any] = {}
+        self._collections_lock = threading.Lock()
+        
+        # LRU of recent search results: (collection, category, top_k, query) -> (expires_at, results)
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        
+        # Embedding matrices for small collections: name -> dict(ids, matrix, ...)
+        # _write_generation bumps on every invalidation so an in-flight load
+        # that raced a write is never stored
+        self._small_cache: Dict[str, Dict[str, Any]] = {}
+        self._write_generation = 0
+        
         print("✓ Vector database initialized")
     
     def _get_collection_name(self, agency: Optional[str] = None) -> str:
         """Get collection name for an agency"""
-        if agency:
-            # Normalize agency name for collection
-            safe_name = agency.lower().replace(" ", "_").replace("-", "_")
-            return f"agency_{safe_name}"
-        return "coachd_shared"
+        return _collection_name_for(agency)
     
     def _get_collection(self, agency: Optional[str] = None):
-        """Get or create a collection for an agency"""
+        """Get or create a collection for an agency (cached per collection name)"""
         collection_name = self._get_collection_name(agency)
-        return self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"description": f"Coachd knowledge base for {agency or 'shared'}"}
-        )
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            with self._collections_lock:
+                collection = self._collections.get(collection_name)
+                if collection is None:
+                    collection = self.client.get_or_create_collection(
+                        name=collection_name,
+                        metadata={"description": f"Coachd knowledge base for {agency or 'shared'}"},
+                        embedding_function=EMBEDDING_FUNCTION
+                    )
+                    self._collections[collection_name] = collection
+        return collection
     
-    def add_chunks(self, chunks: List[DocumentChunk], agency: Optional[str] = None) -> int:
-        """Add document chunks to an agency's collection"""
+    def add_chunks(
+        self,
+        chunks: List[DocumentChunk],
+        agency: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Add document chunks to an agency's collection.
+        Large documents are added in sub-batches (settings.chroma_batch_size)
+        to stay in ChromaDB's efficient batch range.
+        """
         if not chunks:
             return 0
         
         collection = self._get_collection(agency)
+        batch_size = batch_size or settings.chroma_batch_size
         
-        # Prepare data for ChromaDB
-        ids = [chunk.chunk_id for chunk in chunks]
-        documents = [chunk.content for chunk in chunks]
-        metadatas = [
-            {**chunk.metadata, "document_id": chunk.document_id}
-            for chunk in chunks
-        ]
+        # Prepare data for ChromaDB in one pass. Each chunk owns its metadata
+        # dict (DocumentProcessor builds one per chunk), so document_id is set
+        # in place rather than copying every dict.
+        n = len(chunks)
+        ids = [None] * n
+        documents = [None] * n
+        metadatas = [None] * n
+        for i, chunk in enumerate(chunks):
+            ids[i] = chunk.chunk_id
+            documents[i] = chunk.content
+            metadata = chunk.metadata
+            metadata["document_id"] = chunk.document_id
+            metadatas[i] = metadata
         
         # Add to collection (ChromaDB handles embeddings automatically)
-        collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
-        )
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            collection.add(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
+        
+        self._invalidate_search_cache(agency)
         
         return len(chunks)
     
+    def add_chunks_many(self, chunks_by_agency: Dict[Optional[str], List[DocumentChunk]]) -> Dict[Optional[str], int]:
+        """
+        Add chunks for several agencies at once.
+        Each agency's batch runs add_chunks on its own worker thread
+        (ChromaDB embeds and writes outside the GIL).
+        Returns chunks added per agency.
+        """
+        if not chunks_by_agency:
+            return {}
+        
+        workers = min(ADD_CHUNKS_MAX_WORKERS, len(chunks_by_agency))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                agency: pool.submit(self.add_chunks, chunks, agency)
+                for agency, chunks in chunks_by_agency.items()
+            }
+            return {agency: future.result() for agency, future in futures.items()}
+    
     def search(
         self, 
         query: str, 
@@ -78,12 +177,26 @@ class VectorDatabase:
     ) -> List[Dict[str, Any]]:
         """Search for relevant documents in an agency's collection"""
         
+        # Verbatim repeats (same agency/category/top_k/query) are served from cache
+        cache_key = (self._get_collection_name(agency), category, top_k, " ".join(query.split()))
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+        
         collection = self._get_collection(agency)
         
-        # Check if collection has documents
-        if collection.count() == 0:
+        # Check if collection has documents (count once; it's reused below)
+        doc_count = collection.count()
+        if doc_count == 0:
             return []
         
+        # Small collections: exact in-memory search instead of HNSW + IPC
+        if doc_count <= SMALL_COLLECTION_THRESHOLD:
+            formatted_results = self._search_small(collection, query, top_k, category, doc_count)
+            if formatted_results is not None:
+                self._store_cached_search(cache_key, formatted_results)
+                return formatted_results
+        
         # Build where clause for filtering
         where_clause = None
         if category:
@@ -92,25 +205,167 @@ class VectorDatabase:
         # Search (ChromaDB handles query embedding automatically)
         results = collection.query(
             query_texts=[query],
-            n_results=min(top_k, collection.count()),
+            n_results=min(top_k, doc_count),
             where=where_clause,
-            include=["documents", "metadatas", "distances"]
+            include=_QUERY_INCLUDE
         )
         
-        # Format results
+        # Format results (bind the single query's result lists once)
         formatted_results = []
         if results and results['ids'] and results['ids'][0]:
-            for i, chunk_id in enumerate(results['ids'][0]):
-                formatted_results.append({
+            formatted_results = [
+                {
                     "chunk_id": chunk_id,
-                    "content": results['documents'][0][i],
-                    "metadata": results['metadatas'][0][i],
-                    "distance": results['distances'][0][i],
-                    "relevance_score": 1 - results['distances'][0][i]
-                })
+                    "content": content,
+                    "metadata": metadata,
+                    "distance": distance,
+                    "relevance_score": 1 - distance
+                }
+                for chunk_id, content, metadata, distance in zip(
+                    results['ids'][0],
+                    results['documents'][0],
+                    results['metadatas'][0],
+                    results['distances'][0]
+                )
+            ]
         
+        self._store_cached_search(cache_key, formatted_results)
         return formatted_results
     
+    # ============ SMALL COLLECTION FAST PATH ============
+    
+    def _get_small_matrix(self, collection, doc_count: int) -> Dict[str, Any]:
+        """
+        Load a collection's embeddings, documents and metadata into memory.
+        Reused until a write through this instance invalidates it or the chunk
+        count changes (which also catches adds/deletes made elsewhere).
+        """
+        entry = self._small_cache.get(collection.name)
+        if entry is not None and entry["count"] == doc_count:
+            return entry
+        
+        generation = self._write_generation
+        data = collection.get(include=_MATRIX_INCLUDE)
+        matrix = np.asarray(data["embeddings"], dtype=np.float32)
+        metadatas = data["metadatas"]
+        entry = {
+            "count": doc_count,
+            "ids": data["ids"],
+            "documents": data["documents"],
+            "metadatas": metadatas,
+            "categories": np.array([m.get("category") for m in metadatas], dtype=object),
+            "matrix": matrix,
+            "sq_norms": np.einsum("ij,ij->i", matrix, matrix)
+        }
+        
+        # Only cache if no write landed while we were loading
+        if generation == self._write_generation:
+            self._small_cache[collection.name] = entry
+        return entry
+    
+    def _search_small(
+        self,
+        collection,
+        query: str,
+        top_k: int,
+        category: Optional[str],
+        doc_count: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Exact top-k over an in-memory embedding matrix (one GEMV).
+        Returns None when the fast path can't be used, so search falls back to ChromaDB.
+        """
+        # Distances must match ChromaDB's default squared-L2 space
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        if space != "l2":
+            return None
+        
+        try:
+            entry = self._get_small_matrix(collection, doc_count)
+            q = np.asarray(EMBEDDING_FUNCTION([query])[0], dtype=np.float32)
+        except Exception as e:
+            print(f"⚠ Small-collection search fallback: {e}")
+            return None
+        
+        # ||m - q||^2 = ||m||^2 - 2 m.q + ||q||^2
+        distances = entry["sq_norms"] - 2.0 * (entry["matrix"] @ q) + float(q @ q)
+        
+        if category:
+            candidates = np.flatnonzero(entry["categories"] == category)
+        else:
+            candidates = np.arange(len(distances))
+        
+        k = min(top_k, len(candidates))
+        if k <= 0:
+            return []
+        
+        candidate_distances = distances[candidates]
+        if k < len(candidates):
+            top = np.argpartition(candidate_distances, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(candidate_distances[top])]
+        
+        ids = entry["ids"]
+        documents = entry["documents"]
+        metadatas = entry["metadatas"]
+        formatted_results = []
+        for j in top:
+            i = candidates[j]
+            distance = float(candidate_distances[j])
+            formatted_results.append({
+                "chunk_id": ids[i],
+                "content": documents[i],
+                "metadata": metadatas[i],
+                "distance": distance,
+                "relevance_score": 1 - distance
+            })
+        return formatted_results
+    
+    # ============ SEARCH CACHE ============
+    
+    def _get_cached_search(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached search result if present and not expired"""
+        if settings.search_cache_size <= 0:
+            return None
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at < time.monotonic():
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return list(results)
+    
+    def _store_cached_search(self, key: Tuple, results: List[Dict[str, Any]]):
+        """Store a search result, evicting the least recently used entries"""
+        max_size = settings.search_cache_size
+        if max_size <= 0:
+            return
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.monotonic() + settings.search_cache_ttl, list(results))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > max_size:
+                self._search_cache.popitem(last=False)
+    
+    def _invalidate_search_cache(self, agency: Optional[str] = None):
+        """Drop cached search results and fast-path matrix for one agency's collection"""
+        collection_name = self._get_collection_name(agency)
+        self._write_generation += 1
+        self._small_cache.pop(collection_name, None)
+        with self._search_cache_lock:
+            for key in [k for k in self._search_cache if k[0] == collection_name]:
+                del self._search_cache[key]
+    
+    def clear_search_cache(self):
+        """Drop all cached search results (e.g. after writing to collections via self.client)"""
+        self._write_generation += 1
+        self._small_cache.clear()
+        with self._search_cache_lock:
+            self._search_cache.clear()
+    
     def get_document_count(self, agency: Optional[str] = None) -> int:
         """Get the total number of chunks in an agency's collection"""
         collection = self._get_collection(agency)
@@ -119,32 +374,48 @@ class VectorDatabase:
     def list_documents(self, agency: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all unique documents in an agency's collection"""
         collection = self._get_collection(agency)
-        all_items = collection.get(include=["metadatas"])
         
-        documents = {}
-        for metadata in all_items.get('metadatas', []):
-            doc_id = metadata.get('document_id', 'unknown')
-            if doc_id not in documents:
-                documents[doc_id] = {
+        seen = set()
+        documents = []
+        offset = 0
+        # Page through metadata so large agencies aren't loaded in one call
+        while True:
+            page = collection.get(
+                include=_META_INCLUDE,
+                limit=LIST_DOCUMENTS_PAGE_SIZE,
+                offset=offset
+            )
+            metadatas = page.get('metadatas') or ()
+            for metadata in metadatas:
+                doc_id = metadata.get('document_id', 'unknown')
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                documents.append({
                     "document_id": doc_id,
                     "filename": metadata.get('filename', 'unknown'),
                     "category": metadata.get('category', 'general'),
                     "file_type": metadata.get('file_type', 'unknown')
-                }
+                })
+            if len(metadatas) < LIST_DOCUMENTS_PAGE_SIZE:
+                break
+            offset += LIST_DOCUMENTS_PAGE_SIZE
         
-        return list(documents.values())
+        return documents
     
     def delete_document(self, document_id: str, agency: Optional[str] = None) -> int:
         """Delete all chunks belonging to a document"""
         collection = self._get_collection(agency)
         
+        # IDs only; the count is needed by callers (404 on unknown documents)
         results = collection.get(
             where={"document_id": document_id},
-            include=["metadatas"]
+            include=_IDS_ONLY_INCLUDE
         )
         
         if results and results['ids']:
             collection.delete(ids=results['ids'])
+            self._invalidate_search_cache(agency)
             return len(results['ids'])
         
         return 0
@@ -152,6 +423,9 @@ class VectorDatabase:
     def clear_agency(self, agency: str) -> int:
         """Clear all documents for an agency"""
         collection_name = self._get_collection_name(agency)
+        with self._collections_lock:
+            self._collections.pop(collection_name, None)
+        self._invalidate_search_cache(agency)
         
         try:
             collection = self.client.get_collection(collection_name)
@@ -163,23 +437,14 @@ class VectorDatabase:
     
     def list_agencies(self) -> List[str]:
         """List all agencies with collections"""
-        collections = self.client.list_collections()
-        agencies = []
-        for col in collections:
-            if col.name.startswith("agency_"):
-                # Convert collection name back to agency name
-                agency_name = col.name.replace("agency_", "").upper()
-                agencies.append(agency_name)
-        return agencies
+        # chromadb < 0.6 returns Collection objects, newer versions return names
+        names = (getattr(col, "name", col) for col in self.client.list_collections())
+        # Convert collection name back to agency name
+        return [name[AGENCY_PREFIX_LEN:].upper() for name in names if name.startswith(AGENCY_PREFIX)]
 
 
 # Singleton instance
-_db_instance: Optional[VectorDatabase] = None
-
-
+@functools.cache
 def get_vector_db() -> VectorDatabase:
     """Get the singleton vector database instance"""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = VectorDatabase()
-    return _db_instance
+    return VectorDatabase()
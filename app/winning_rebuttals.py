@@ -15,6 +15,14 @@ This is the feedback loop that makes the AI smarter over time.
 
 import os
 import json
+import hashlib
+import functools
+import threading
+import orjson
+from dataclasses import dataclass
+from types import MappingProxyType
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from typing import Optional, List
@@ -33,9 +41,10 @@ WINNING_REBUTTALS_FILE = "WINNING_REBUTTALS.md"
 METADATA_FILE = "winning_rebuttals_meta.json"
 MIN_OUTCOMES_THRESHOLD = 20  # Don't generate until we have enough data
 MIN_SUCCESS_COUNT = 2  # Minimum closes to include a rebuttal
+REINDEX_MAX_WORKERS = 16  # Agency collections indexed concurrently
 
-# Objection type labels for the document
-OBJECTION_LABELS = {
+# Objection type labels for the document (read-only)
+OBJECTION_LABELS = MappingProxyType({
     "price": "Price / Can't Afford",
     "spouse": "Spouse / Need to Discuss",
     "think": "Want to Think About It",
@@ -44,11 +53,94 @@ OBJECTION_LABELS = {
     "interest": "Not Interested",
     "trust": "Trust / Rapport Issues",
     "other": "Other Objections"
-}
+})
+_objection_label = OBJECTION_LABELS.get
+_objection_fields = itemgetter('objection', 'count', 'percentage')
+
+
+# Markdown templates for the generated document (sections are joined with "\n")
+_HEADER_TMPL = """# Proven Rebuttals That Close Deals
+
+> **SYSTEM DOCUMENT** - Auto-generated from real call outcomes.
+> These rebuttals have been proven to lead to closed deals.
+> Last updated: {updated}
+
+---
+
+## Top Performing Rebuttals
+
+These phrases have the highest close rates when used:
+"""
+
+_TOP_ITEM_TMPL = """### {i}. {rate}% Success Rate
+
+> "{text}"
+
+*Used {uses} times, led to {closes} closes*
+"""
+
+_OBJECTIONS_TMPL = """---
+
+## Common Objections to Overcome
+
+These are the objections that most often kill deals. Focus training here:
+
+{items}
+"""
+
+_OBJECTION_ITEM_TMPL = "- **{label}**: {count} lost deals ({percentage}%)"
+
+_FOOTER_TMPL = """---
+
+## How to Use This Document
+
+1. **During calls**: The AI will automatically prioritize these proven rebuttals
+2. **For training**: Review top performers with new agents
+3. **For coaching**: Identify which objection types need more training material
+
+*This document updates automatically as more call data is collected.*"""
+
+
+def _dump_meta(meta: dict) -> bytes:
+    """Serialize metadata to compact JSON bytes"""
+    return orjson.dumps(meta)
+
+
+def _load_meta(data: bytes) -> dict:
+    """Parse metadata JSON bytes"""
+    return orjson.loads(data)
+
+
+def _atomic_write(path: str, data: bytes) -> int:
+    """
+    Write bytes to a temp file with raw os.write calls, fsync, then rename over path.
+    Returns the written file's mtime_ns (rename keeps it) for the read caches.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        mtime = os.fstat(fd).st_mtime_ns
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    return mtime
 
 
 # ==================== GENERATOR ====================
 
+@dataclass
+class GenerationState:
+    """Outcome data gathered once per check/generation"""
+    outcome_count: int
+    winning: List[WinningGuidance]
+    ready: bool
+    reason: str
+
+
 class WinningRebuttalsGenerator:
     """
     Generates and manages the winning rebuttals master document.
@@ -58,27 +150,50 @@ class WinningRebuttalsGenerator:
         self.storage = get_outcome_storage()
         self.doc_path = os.path.join(SYSTEM_DOCS_PATH, WINNING_REBUTTALS_FILE)
         self.meta_path = os.path.join(SYSTEM_DOCS_PATH, METADATA_FILE)
-        self._ensure_paths()
+        self._meta: Optional[tuple] = None  # (mtime_ns, parsed metadata)
+        self._doc: Optional[tuple] = None  # (mtime_ns, document content)
+        self._paths_ready = False
+        # Admin routes run generate() in worker threads; one generation at a time
+        self._generate_lock = threading.Lock()
     
     def _ensure_paths(self):
-        """Ensure system docs directory exists"""
-        os.makedirs(SYSTEM_DOCS_PATH, exist_ok=True)
+        """Ensure system docs directory exists (once, before the first write)"""
+        if not self._paths_ready:
+            os.makedirs(SYSTEM_DOCS_PATH, exist_ok=True)
+            self._paths_ready = True
     
-    def should_generate(self) -> tuple[bool, str]:
+    def _compute_state(self, min_success_count: int = MIN_SUCCESS_COUNT, force: bool = False) -> GenerationState:
         """
-        Check if we should generate/update the document.
-        Returns (should_generate, reason)
+        Read outcome count and winning guidance once.
+        With force, the outcome threshold is ignored.
         """
         outcome_count = self.storage.get_outcome_count()
         
-        if outcome_count < MIN_OUTCOMES_THRESHOLD:
-            return False, f"Need {MIN_OUTCOMES_THRESHOLD} outcomes, have {outcome_count}"
+        if outcome_count < MIN_OUTCOMES_THRESHOLD and not force:
+            return GenerationState(
+                outcome_count, [], False,
+                f"Need {MIN_OUTCOMES_THRESHOLD} outcomes, have {outcome_count}"
+            )
         
-        winning = self.storage.get_winning_guidance(MIN_SUCCESS_COUNT)
+        winning = self.storage.get_winning_guidance(min_success_count)
         if not winning:
-            return False, "No rebuttals have met the success threshold yet"
+            return GenerationState(
+                outcome_count, winning, False,
+                "No rebuttals have met the success threshold yet"
+            )
         
-        return True, f"Ready: {outcome_count} outcomes, {len(winning)} winning rebuttals"
+        return GenerationState(
+            outcome_count, winning, True,
+            f"Ready: {outcome_count} outcomes, {len(winning)} winning rebuttals"
+        )
+    
+    def should_generate(self) -> tuple[bool, str]:
+        """
+        Check if we should generate/update the document.
+        Returns (should_generate, reason)
+        """
+        state = self._compute_state()
+        return state.ready, state.reason
     
     def generate(self, force: bool = False) -> dict:
         """
@@ -90,45 +205,57 @@ class WinningRebuttalsGenerator:
         Returns:
             Status dict with success, message, and stats
         """
-        # Check if we should generate
-        should, reason = self.should_generate()
-        if not should and not force:
+        with self._generate_lock:
+            return self._generate(force)
+    
+    def _generate(self, force: bool) -> dict:
+        """generate() body; caller holds _generate_lock"""
+        # Check if we should generate (one pass over outcomes + guidance)
+        state = self._compute_state(1 if force else MIN_SUCCESS_COUNT, force=force)
+        if not state.ready:
             return {
                 "success": False,
-                "message": reason,
+                "message": "No winning rebuttals found" if force else state.reason,
                 "generated": False
             }
         
-        # Get winning guidance
-        winning = self.storage.get_winning_guidance(MIN_SUCCESS_COUNT if not force else 1)
-        
-        if not winning:
-            return {
-                "success": False,
-                "message": "No winning rebuttals found",
-                "generated": False
-            }
+        winning = state.winning
         
         # Get common objections for context
         objections = self.storage.get_common_objections()
         
+        # Skip the rewrite (and downstream re-embedding) if the inputs haven't changed
+        source_hash = self._source_hash(winning, objections)
+        meta = self.get_metadata()
+        if not force and meta and meta.get('content_hash') == source_hash and self.document_exists():
+            print("[WINNING] No new outcome data since last generation, skipping")
+            return {
+                "success": True,
+                "message": "Unchanged since last generation",
+                "generated": False,
+                "unchanged": True,
+                "path": self.doc_path
+            }
+        
         # Generate the document
-        doc_content = self._build_document(winning, objections)
+        now = datetime.now()
+        doc_content = self._build_document(winning, objections, now)
+        
+        self._ensure_paths()
         
-        # Write the document
-        with open(self.doc_path, 'w') as f:
-            f.write(doc_content)
+        # Write the document (atomically, so a concurrent reindex never reads a partial file)
+        self._doc = (_atomic_write(self.doc_path, doc_content.encode("utf-8")), doc_content)
         
         # Update metadata
         meta = {
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
             "rebuttal_count": len(winning),
-            "total_outcomes": self.storage.get_outcome_count(),
-            "version": self._get_next_version()
+            "total_outcomes": state.outcome_count,
+            "version": self._get_next_version(),
+            "content_hash": source_hash
         }
         
-        with open(self.meta_path, 'w') as f:
-            json.dump(meta, f, indent=2)
+        self._write_metadata(meta)
         
         print(f"[WINNING] Generated document with {len(winning)} rebuttals")
         
@@ -143,85 +270,99 @@ class WinningRebuttalsGenerator:
             }
         }
     
-    def _build_document(self, winning: list[WinningGuidance], objections: list) -> str:
+    def _source_hash(self, winning: list[WinningGuidance], objections: list) -> str:
+        """Hash of the data the document is built from (excludes the timestamp)"""
+        source = json.dumps(
+            [
+                [(w.text, w.success_rate, w.success_count, w.total_uses) for w in winning],
+                objections
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _build_document(
+        self,
+        winning: list[WinningGuidance],
+        objections: list,
+        now: Optional[datetime] = None
+    ) -> str:
         """Build the markdown document content"""
-        
-        lines = [
-            "# Proven Rebuttals That Close Deals",
-            "",
-            "> **SYSTEM DOCUMENT** - Auto-generated from real call outcomes.",
-            "> These rebuttals have been proven to lead to closed deals.",
-            "> Last updated: " + datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            "",
-            "---",
-            "",
-        ]
+        updated = (now or datetime.now()).strftime("%B %d, %Y at %I:%M %p")
         
         # Top performers section
-        lines.append("## Top Performing Rebuttals")
-        lines.append("")
-        lines.append("These phrases have the highest close rates when used:")
-        lines.append("")
+        top = "\n".join(
+            _TOP_ITEM_TMPL.format(
+                i=i,
+                rate=w.success_rate,
+                text=w.text,
+                uses=w.total_uses,
+                closes=w.success_count
+            )
+            for i, w in enumerate(winning[:10], 1)
+        )
         
-        for i, w in enumerate(winning[:10], 1):
-            lines.append(f"### {i}. {w.success_rate}% Success Rate")
-            lines.append("")
-            lines.append(f"> \"{w.text}\"")
-            lines.append("")
-            lines.append(f"*Used {w.total_uses} times, led to {w.success_count} closes*")
-            lines.append("")
+        sections = [_HEADER_TMPL.format(updated=updated)]
+        if top:
+            sections.append(top)
         
         # Objection-specific section if we have data
         if objections:
-            lines.append("---")
-            lines.append("")
-            lines.append("## Common Objections to Overcome")
-            lines.append("")
-            lines.append("These are the objections that most often kill deals. Focus training here:")
-            lines.append("")
-            
-            for obj in objections[:5]:
-                label = OBJECTION_LABELS.get(obj['objection'], obj['objection'])
-                lines.append(f"- **{label}**: {obj['count']} lost deals ({obj['percentage']}%)")
-            
-            lines.append("")
+            objection_lines = "\n".join(
+                _OBJECTION_ITEM_TMPL.format(
+                    label=_objection_label(code, code),
+                    count=count,
+                    percentage=percentage
+                )
+                for code, count, percentage in map(_objection_fields, objections[:5])
+            )
+            sections.append(_OBJECTIONS_TMPL.format(items=objection_lines))
         
         # Usage instructions
-        lines.append("---")
-        lines.append("")
-        lines.append("## How to Use This Document")
-        lines.append("")
-        lines.append("1. **During calls**: The AI will automatically prioritize these proven rebuttals")
-        lines.append("2. **For training**: Review top performers with new agents")
-        lines.append("3. **For coaching**: Identify which objection types need more training material")
-        lines.append("")
-        lines.append("*This document updates automatically as more call data is collected.*")
+        sections.append(_FOOTER_TMPL)
         
-        return "\n".join(lines)
+        return "\n".join(sections)
+    
+    def _write_metadata(self, meta: dict):
+        """Write metadata as compact JSON via temp file + rename (never torn)"""
+        mtime = _atomic_write(self.meta_path, _dump_meta(meta))
+        self._meta = (mtime, meta)
     
     def _get_next_version(self) -> int:
         """Get next version number"""
-        try:
-            with open(self.meta_path, 'r') as f:
-                meta = json.load(f)
-                return meta.get('version', 0) + 1
-        except:
+        meta = self.get_metadata()
+        if not meta:
             return 1
+        return meta.get('version', 0) + 1
     
     def get_metadata(self) -> Optional[dict]:
-        """Get current document metadata"""
+        """Get current document metadata (re-parsed only when the file changes)"""
         try:
-            with open(self.meta_path, 'r') as f:
-                return json.load(f)
-        except:
+            mtime = os.stat(self.meta_path).st_mtime_ns
+            if self._meta is None or self._meta[0] != mtime:
+                with open(self.meta_path, 'rb') as f:
+                    self._meta = (mtime, _load_meta(f.read()))
+            return self._meta[1]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # Unreadable or corrupt (JSONDecodeError is a ValueError)
+            print(f"[WINNING] Could not read metadata: {e}")
             return None
     
     def get_document(self) -> Optional[str]:
-        """Get current document content"""
+        """Get current document content (re-read only when the file changes)"""
         try:
-            with open(self.doc_path, 'r') as f:
-                return f.read()
-        except:
+            mtime = os.stat(self.doc_path).st_mtime_ns
+            if self._doc is None or self._doc[0] != mtime:
+                with open(self.doc_path, 'r') as f:
+                    self._doc = (mtime, f.read())
+            return self._doc[1]
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"[WINNING] Could not read document: {e}")
             return None
     
     def document_exists(self) -> bool:
@@ -231,6 +372,11 @@ class WinningRebuttalsGenerator:
 
 # ==================== CHROMADB INTEGRATION ====================
 
+# Same sanitizer as vector_db.py (kept local so this module doesn't import chromadb)
+_AGENCY_NAME_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+
+@functools.lru_cache(maxsize=256)
 def _get_agency_collection_name(agency: Optional[str] = None) -> str:
     """
     Get collection name matching vector_db.py pattern.
@@ -238,60 +384,56 @@ def _get_agency_collection_name(agency: Optional[str] = None) -> str:
     that RAG searches during guidance generation.
     """
     if agency:
-        safe_name = agency.lower().replace(" ", "_").replace("-", "_")
-        return f"agency_{safe_name}"
+        return f"agency_{agency.lower().translate(_AGENCY_NAME_TRANS)}"
     return "coachd_shared"
 
 
-def reindex_winning_rebuttals(chroma_client, agency: Optional[str] = None) -> dict:
+def _content_hash(content: str) -> str:
+    """Stable hash of the document text, stored on each indexed copy"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _index_content_into(
+    chroma_client,
+    agency: Optional[str],
+    content: str,
+    meta: Optional[dict],
+    content_hash: Optional[str] = None
+) -> dict:
     """
-    Re-index the winning rebuttals document into an agency's ChromaDB collection.
-    
-    CRITICAL: This indexes into the SAME collection that RAG searches,
-    so the AI will actually find and use these winning rebuttals.
-    
-    This should be called:
-    1. After generating/updating the document
-    2. On a weekly schedule
-    3. Manually via admin endpoint
-    
-    Args:
-        chroma_client: ChromaDB client instance
-        agency: Agency code (e.g., "ADERHOLT") - indexes into agency_{code} collection
-    
-    Returns:
-        Status dict
+    Upsert already-read document content into one agency's collection.
+    Callers read the document once and pass it in.
     """
-    generator = WinningRebuttalsGenerator()
-    
-    if not generator.document_exists():
-        return {
-            "success": False,
-            "message": "Winning rebuttals document does not exist yet"
-        }
-    
     try:
-        content = generator.get_document()
-        meta = generator.get_metadata()
-        
-        if not content:
-            return {"success": False, "message": "Could not read document"}
-        
         # Use the same collection naming as vector_db.py
         collection_name = _get_agency_collection_name(agency)
-        collection = chroma_client.get_or_create_collection(name=collection_name)
+        # Share vector_db's embedder so the process holds one copy of the model
+        from .vector_db import EMBEDDING_FUNCTION
+        collection = chroma_client.get_or_create_collection(
+            name=collection_name,
+            embedding_function=EMBEDDING_FUNCTION
+        )
         
         # Use a fixed ID so we update rather than duplicate
         doc_id = "SYSTEM_WINNING_REBUTTALS"
+        content_hash = content_hash or _content_hash(content)
         
-        # Delete existing if present
-        try:
-            collection.delete(ids=[doc_id])
-        except:
-            pass
+        # Skip re-embedding if this collection already has the same content
+        existing = collection.get(ids=[doc_id], include=["metadatas"])
+        existing_meta = existing['metadatas'][0] if existing and existing.get('metadatas') else None
+        if existing_meta and existing_meta.get('content_hash') == content_hash:
+            print(f"[WINNING] '{collection_name}' already up to date, skipping")
+            return {
+                "success": True,
+                "message": f"Document already current in {collection_name}",
+                "collection": collection_name,
+                "agency": agency,
+                "version": existing_meta.get('version', 1),
+                "skipped": True
+            }
         
-        # Add with special metadata
-        collection.add(
+        # Upsert with special metadata (replaces the previous version in one call)
+        collection.upsert(
             documents=[content],
             ids=[doc_id],
             metadatas=[{
@@ -302,7 +444,8 @@ def reindex_winning_rebuttals(chroma_client, agency: Optional[str] = None) -> di
                 "generated": True,
                 "version": meta.get('version', 1) if meta else 1,
                 "last_updated": meta.get('last_updated', '') if meta else '',
-                "priority": "high"  # Signal to RAG to weight this higher
+                "priority": "high",  # Signal to RAG to weight this higher
+                "content_hash": content_hash
             }]
         )
         
@@ -324,9 +467,56 @@ def reindex_winning_rebuttals(chroma_client, agency: Optional[str] = None) -> di
         }
 
 
+def _read_document_for_indexing() -> tuple[Optional[str], Optional[dict], Optional[dict]]:
+    """
+    Read the document and metadata once for indexing.
+    Returns (content, meta, error) - error is a status dict when unavailable.
+    """
+    generator = get_generator()
+    
+    if not generator.document_exists():
+        return None, None, {
+            "success": False,
+            "message": "Winning rebuttals document does not exist yet"
+        }
+    
+    content = generator.get_document()
+    if not content:
+        return None, None, {"success": False, "message": "Could not read document"}
+    
+    return content, generator.get_metadata(), None
+
+
+def reindex_winning_rebuttals(chroma_client, agency: Optional[str] = None) -> dict:
+    """
+    Re-index the winning rebuttals document into an agency's ChromaDB collection.
+    
+    CRITICAL: This indexes into the SAME collection that RAG searches,
+    so the AI will actually find and use these winning rebuttals.
+    
+    This should be called:
+    1. After generating/updating the document
+    2. On a weekly schedule
+    3. Manually via admin endpoint
+    
+    Args:
+        chroma_client: ChromaDB client instance
+        agency: Agency code (e.g., "ADERHOLT") - indexes into agency_{code} collection
+    
+    Returns:
+        Status dict
+    """
+    content, meta, error = _read_document_for_indexing()
+    if error:
+        return error
+    
+    return _index_content_into(chroma_client, agency, content, meta)
+
+
 def reindex_all_agencies(chroma_client, agencies: list[str]) -> dict:
     """
     Re-index winning rebuttals into ALL agency collections.
+    The document is read once, then indexed into each collection.
     
     Args:
         chroma_client: ChromaDB client instance
@@ -335,22 +525,36 @@ def reindex_all_agencies(chroma_client, agencies: list[str]) -> dict:
     Returns:
         Status dict with results per agency
     """
-    generator = WinningRebuttalsGenerator()
-    
-    if not generator.document_exists():
-        return {
-            "success": False,
-            "message": "Winning rebuttals document does not exist yet"
-        }
+    content, meta, error = _read_document_for_indexing()
+    if error:
+        return error
     
+    return reindex_all_agencies_with_content(chroma_client, agencies, content, meta)
+
+
+def reindex_all_agencies_with_content(
+    chroma_client,
+    agencies: list[str],
+    content: str,
+    meta: Optional[dict]
+) -> dict:
+    """
+    Index document content the caller already has into each agency's collection.
+    Skips the existence check and file reads done by reindex_all_agencies.
+    """
+    content_hash = _content_hash(content)
     results = {}
-    success_count = 0
     
-    for agency in agencies:
-        result = reindex_winning_rebuttals(chroma_client, agency)
-        results[agency] = result
-        if result.get('success'):
-            success_count += 1
+    # Each worker only does ChromaDB calls (I/O and embedding release the GIL)
+    if agencies:
+        with ThreadPoolExecutor(max_workers=min(REINDEX_MAX_WORKERS, len(agencies))) as pool:
+            futures = {
+                agency: pool.submit(_index_content_into, chroma_client, agency, content, meta, content_hash)
+                for agency in agencies
+            }
+            results = {agency: future.result() for agency, future in futures.items()}
+    
+    success_count = sum(1 for result in results.values() if result.get('success'))
     
     return {
         "success": success_count == len(agencies),
@@ -370,7 +574,7 @@ def weekly_refresh(chroma_client, agencies: list[str] = None) -> dict:
         chroma_client: ChromaDB client instance
         agencies: List of agency codes. If None, indexes to shared collection only.
     """
-    generator = WinningRebuttalsGenerator()
+    generator = get_generator()
     
     # Generate/update document
     gen_result = generator.generate()
@@ -378,12 +582,23 @@ def weekly_refresh(chroma_client, agencies: list[str] = None) -> dict:
     if not gen_result.get('success') and not gen_result.get('generated'):
         return gen_result
     
-    # Re-index into ChromaDB for all agencies
+    # generate() just wrote (or confirmed) the document, so index straight from
+    # the generator's in-memory copy instead of the document_exists + read path
+    content, meta = generator.get_document(), generator.get_metadata()
+    if not content:
+        return {
+            "success": False,
+            "generation": gen_result,
+            "indexing": {"success": False, "message": "Could not read document"}
+        }
+    
+    # Re-index into ChromaDB for all agencies (collections that already hold
+    # the current content are skipped, so an unchanged document costs no embedding)
     if agencies:
-        index_result = reindex_all_agencies(chroma_client, agencies)
+        index_result = reindex_all_agencies_with_content(chroma_client, agencies, content, meta)
     else:
         # Fallback to shared collection
-        index_result = reindex_winning_rebuttals(chroma_client, agency=None)
+        index_result = _index_content_into(chroma_client, None, content, meta)
     
     return {
         "success": index_result.get('success', False),
@@ -394,10 +609,6 @@ def weekly_refresh(chroma_client, agencies: list[str] = None) -> dict:
 
 # ==================== SINGLETON ====================
 
-_generator_instance = None
-
+@functools.cache
 def get_generator() -> WinningRebuttalsGenerator:
-    global _generator_instance
-    if _generator_instance is None:
-        _generator_instance = WinningRebuttalsGenerator()
-    return _generator_instance
\ No newline at end of file
+    return WinningRebuttalsGenerator()
\ No newline at end of file